@@ -5,33 +5,46 @@ Python script for plotting contours of data points.
 
 Following third-party libraries are required:
     matplotlib
+    numpy
 """
 
+import collections
+import hashlib
+import numpy
+import matplotlib.contour as Contour
+import matplotlib.figure as Figure
 import matplotlib.pyplot as PyPlot
 import matplotlib.ticker as Ticker
 
 
+# Filled contours computed by contour2D(..., cache = True), indexed by 
+# a digest of the input data and the color bar settings
+contourCache = collections.OrderedDict()
+contourCacheSize = 16
+
 def contour2D(X: list, Y: list, Z: list, filename = '', 
               xLogScale = False, yLogScale = False, 
               xlim = None, ylim = None, fillRange = None, 
               xLabel = 'x', yLabel = 'y', fillLabel = '', 
               fillTickCount = 11, fillLogScale = False, 
-              fillLogScaleBase = 2) -> object:
+              fillLogScaleBase = 2, cache = False, append = None) -> object:
     '''
     Draw a 2-D contour plot filled with colors.
 
     Parameters
     ----------
-    X : list
+    X : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
-    Y : list
+    Y : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the Y (vertical) axis.
-    Z : list
-        A list of list of numeric values representing the data points.
+    Z : list or numpy.ndarray
+        A list of list (or a 2-D array) of numeric values representing 
+        the data points.
         The length of the outer list should equal to that of 'X', and 
         the length of the inner list should equal to that of 'Y'.
+        Values of None are regarded as missing data (NaN).
     filename : str, optional
         A string indicating the target image file to which the plot is saved. 
         The default is an empty string, i.e. no file will be generated.
@@ -65,14 +78,39 @@ def contour2D(X: list, Y: list, Z: list, filename = '',
         A boolean indicating whether the ticks on the color bar should be of 
         logarithm scale. 
         The default is False.
+    cache : bool, optional
+        A boolean indicating whether the computed contours should be kept 
+        for, and reused by, later calls with identical 'X', 'Y', 'Z' and 
+        color bar settings.
+        The default is False.
+    append : matplotlib.Figure or NoneType, optional
+        An object of matplotlib.Figure to which the contour plot is appended, 
+        or None if a new Figure shall be created. The default is None.
 
     Returns
     -------
     object
         An object of class 'matplotlib.Figure' holding the contour plot.
     '''
-    figure, axes = PyPlot.subplots()
-    if len(X) == 0 or len(Y) == 0 or len(X) != len(Z) or len(Y) != len(Z[0]):
+    # Get an existing plot
+    if type(append) == Figure.Figure:
+        figure = append
+        if len(append.get_axes()) > 0:
+            axes = figure.get_axes()[0]
+        else:
+            axes = figure.subplots()
+    else:
+        figure, axes = PyPlot.subplots()
+    
+    # Convert the data once (None values in Z become NaN)
+    X = numpy.asarray(X, dtype = float)
+    Y = numpy.asarray(Y, dtype = float)
+    try:
+        Z = numpy.asarray(Z, dtype = float)
+    except ValueError:
+        # Inner lists of Z are of different lengths
+        return figure
+    if X.size == 0 or Y.size == 0 or Z.shape != (X.size, Y.size):
         return figure
     
     if fillLogScale:
@@ -81,9 +119,33 @@ def contour2D(X: list, Y: list, Z: list, filename = '',
     else:
         tickerLocator = Ticker.LinearLocator(numticks = fillTickCount)
     
-    contour = axes.contourf(X, Y, 
-                            [[z[i] for z in Z] for i in range(0, len(Z[0]))], 
-                            locator = tickerLocator, cmap = 'turbo')
+    if cache:
+        digest = hashlib.sha1()
+        for data in (X, Y, Z):
+            digest.update(numpy.ascontiguousarray(data))
+        key = (Z.shape, digest.digest(), 
+               fillTickCount, fillLogScale, fillLogScaleBase)
+    else:
+        key = None
+    if key in contourCache:
+        # Rebuild the filled contours from the cached polygons
+        levels, segments, kinds = contourCache[key]
+        contourCache.move_to_end(key)
+        contour = Contour.ContourSet(axes, levels, segments, kinds, 
+                                     filled = True, locator = tickerLocator, 
+                                     cmap = 'turbo')
+    else:
+        contour = axes.contourf(X, Y, Z.T, 
+                                locator = tickerLocator, cmap = 'turbo')
+        if key is not None:
+            # Keep one (compound) path per level rather than splitting 
+            # every level into its connected components
+            paths = contour.get_paths()
+            contourCache[key] = (contour.levels, 
+                                 [[path.vertices] for path in paths], 
+                                 [[path.codes] for path in paths])
+            if len(contourCache) > contourCacheSize:
+                contourCache.popitem(last = False)
     colorbar = figure.colorbar(contour)
     if len(fillLabel) > 0:
         colorbar.ax.set_ylabel(fillLabel)
@@ -109,14 +171,15 @@ def contour2Dscatter(X: list, Y: list, Z: list, scatterX: list, scatterY: list,
     
     Parameters
     ----------
-    X : list
+    X : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
-    Y : list
+    Y : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the Y (vertical) axis.
-    Z : list
-        A list of list of numeric values representing the data points.
+    Z : list or numpy.ndarray
+        A list of list (or a 2-D array) of numeric values representing 
+        the data points.
         The length of the outer list should equal to that of 'X', and 
         the length of the inner list should equal to that of 'Y'.
     scatterX : list
@@ -150,16 +213,19 @@ def contour2Dscatter(X: list, Y: list, Z: list, scatterX: list, scatterY: list,
         An object of class 'matplotlib.Figure' holding the contour plot 
         and the scatter plot.
     """
+    # Save the plot only once, after all elements are drawn
+    filename = kwargs.pop('filename', '')
     figure = contour2D(X, Y, Z, **kwargs)
     
     axes = figure.axes[0]
     axes.scatter(scatterX, scatterY, s = sizes, c = colors, marker = marker)
     if labels != None:
-        for x, y, label in zip(scatterX, scatterY, labels):
-            axes.annotate(label, (x, y), textcoords = 'offset points',
+        parameters = dict(textcoords = 'offset points', 
                           xytext = (0, 2), ha = 'center')
-    if 'filename' in kwargs and len(kwargs['filename']) > 0:
-        figure.savefig(kwargs['filename'], format = 'png')
+        for x, y, label in zip(scatterX, scatterY, labels):
+            axes.annotate(label, (x, y), **parameters)
+    if len(filename) > 0:
+        figure.savefig(filename, format = 'png')
     return figure
 
 def contour2DVLine(X: list, Y: list, Z: list, x0: list, 
@@ -169,14 +235,15 @@ def contour2DVLine(X: list, Y: list, Z: list, x0: list,
     
     Parameters
     ----------
-    X : list
+    X : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
-    Y : list
+    Y : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the Y (vertical) axis.
-    Z : list
-        A list of list of numeric values representing the data points.
+    Z : list or numpy.ndarray
+        A list of list (or a 2-D array) of numeric values representing 
+        the data points.
         The length of the outer list should equal to that of 'X', and 
         the length of the inner list should equal to that of 'Y'.
     x0 : list
@@ -197,6 +264,8 @@ def contour2DVLine(X: list, Y: list, Z: list, x0: list,
         An object of class 'matplotlib.Figure' holding the contour plot 
         and the line plot.
     """
+    # Save the plot only once, after all elements are drawn
+    filename = kwargs.pop('filename', '')
     figure = contour2D(X, Y, Z, **kwargs)
     
     if type(x0) != list:
@@ -207,6 +276,6 @@ def contour2DVLine(X: list, Y: list, Z: list, x0: list,
         styles = [styles] * len(x0)
     for X, color, style in zip(x0, colors, styles):
         figure.axes[0].axvline(X, color = color, linestyle = style)
-    if 'filename' in kwargs and len(kwargs['filename']) > 0:
-        figure.savefig(kwargs['filename'], format = 'png')
+    if len(filename) > 0:
+        figure.savefig(filename, format = 'png')
     return figure
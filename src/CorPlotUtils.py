@@ -13,8 +13,33 @@ import matplotlib.figure as Figure
 import matplotlib.pyplot as PyPlot
 
 
-def filterFinite(values: list) -> list:
-    return [X != numpy.inf and X != -numpy.inf for X in values]
+def filterFinite(values: list) -> numpy.ndarray:
+    return numpy.isfinite(numpy.asarray(values, dtype = float))
+
+def applyFunction(function: object, x: list) -> numpy.ndarray:
+    # Evaluate the whole array at once if the callable supports it, 
+    # otherwise fall back to one call per (original) element
+    try:
+        xArray = numpy.asarray(x, dtype = float)
+        y = numpy.asarray(function(xArray), dtype = float)
+        if y.shape == xArray.shape:
+            return y
+    except Exception:
+        pass
+    return numpy.asarray(list(map(function, x)), dtype = float)
+
+def fitLine(x: numpy.ndarray, y: numpy.ndarray) -> tuple:
+    # Least-squares fit of y = a1 * x + a0 using centered sums
+    xMean = x.mean()
+    yMean = y.mean()
+    dx = x - xMean
+    sxx = numpy.dot(dx, dx)
+    if sxx == 0:
+        # Let polyfit handle degenerate data (e.g. all-equal x)
+        a1, a0 = numpy.polyfit(x, y, 1)
+        return a1, a0
+    a1 = numpy.dot(dx, y - yMean) / sxx
+    return a1, yMean - a1 * xMean
 
 def scatter(x: list, y: list, filename = '', transform = None, 
             labels = None, colors = None, marker = 'o', 
@@ -29,10 +54,10 @@ def scatter(x: list, y: list, filename = '', transform = None,
 
     Parameters
     ----------
-    x : list
+    x : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
-    y : list
+    y : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the Y (vertical) axis.
     filename : str, optional
@@ -103,13 +128,15 @@ def scatter(x: list, y: list, filename = '', transform = None,
     '''
     # Transform the data before plotting
     if transform != None:
-        x = list(map(transform, x))
-        y = list(map(transform, y))
+        x = applyFunction(transform, x)
+        y = applyFunction(transform, y)
     
-    # Exclude infinite values
-    masks = [X and Y for X, Y in zip(filterFinite(x), filterFinite(y))]
-    x = [X for X, mask in zip(x, masks) if mask]
-    y = [X for X, mask in zip(y, masks) if mask]
+    # Exclude infinite and NaN values
+    x = numpy.asarray(x, dtype = float)
+    y = numpy.asarray(y, dtype = float)
+    masks = filterFinite(x) & filterFinite(y)
+    x = x[masks]
+    y = y[masks]
     
     # Get an existing plot
     update = False
@@ -133,16 +160,16 @@ def scatter(x: list, y: list, filename = '', transform = None,
     
     # Add labels alongside points
     if labels != None:
-        for pointX, pointY, label in zip(x, y, labels):
-            axes.annotate(label, (pointX, pointY), 
-                          textcoords = 'offset points',
+        parameters = dict(textcoords = 'offset points', 
                           xytext = (0, 2), ha = 'center')
+        for pointX, pointY, label in zip(x, y, labels):
+            axes.annotate(label, (pointX, pointY), **parameters)
     
     # Draw a linearly fitted curve
     if linearFit:
-        a1, a0 = numpy.polyfit(x, y, deg = 1)
-        x = sorted(x)
-        axes.plot(x, [x0 * a1 + a0 for x0 in x], 'r-')
+        a1, a0 = fitLine(x, y)
+        xSorted = numpy.sort(x)
+        axes.plot(xSorted, numpy.polyval((a1, a0), xSorted), 'r-')
         if showFormula:
             axes.text(0.7, 0.05, 'y = {:.2} x + {:.2}'.format(a1, a0),
                       transform = axes.transAxes)
@@ -177,15 +204,17 @@ def scatterCurve(x: list, y: list, curve: object, filename = '',
     
     Parameters
     ----------
-    x : list
+    x : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
-    y : list
+    y : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the Y (vertical) axis.
     curve: object
         A callable object used to draw the additional curve. It should accept 
         one input (an 'x' value) and give one ouput (a 'y' value).
+        For best performance, it should also accept a numpy array of 'x' 
+        values and return an array of 'y' values of the same shape.
     filename : str, optional
         A string indicating the target image file to which the plot is saved. 
         The default is an empty string, i.e. no file will be generated.int.
@@ -219,20 +248,23 @@ def scatterCurve(x: list, y: list, curve: object, filename = '',
     axes = figure.get_axes()[0]
     
     # Make a (smooth) line plot
+    x = numpy.asarray(x, dtype = float)
     xLogScale = kwargs.get('xLogScale', False)
     xlim = kwargs.get('xlim', None)
-    xRange = (min(x0 for x0 in x if x0 > 0) if xLogScale else min(x), max(x))
+    # Take the range over finite values only (a single NaN would spoil it)
+    xFinite = x[filterFinite(x)]
+    xRange = (xFinite[xFinite > 0].min() if xLogScale else xFinite.min(), 
+              xFinite.max())
     if xlim != None:
         xRange = (xlim[0] if xlim[0] is not None else xRange[0], 
                   xlim[1] if xlim[1] is not None else xRange[1])
     if xLogScale:
-        xDense = numpy.logspace(numpy.log(xRange[0]), numpy.log(xRange[1]), 
-                                base = numpy.e, 
-                                num = len(x) * samplingDensity)
+        xDense = numpy.geomspace(xRange[0], xRange[1], 
+                                 num = len(x) * samplingDensity)
     else:
         xDense = numpy.linspace(xRange[0], xRange[1], 
                                 num = len(x) * samplingDensity)
-    axes.plot(xDense, [curve(X) for X in xDense], label = curveLabel, 
+    axes.plot(xDense, applyFunction(curve, xDense), label = curveLabel, 
               color = curveColor, linestyle = curveStyle) 
     
     # Set the legend
@@ -316,8 +348,7 @@ def curve(function: object, filename = '',
               else min(limits), 
               max(limits))
     if xLogScale:
-        xDense = numpy.logspace(numpy.log(xRange[0]), numpy.log(xRange[1]), 
-                                base = numpy.e, num = samplingDensity)
+        xDense = numpy.geomspace(xRange[0], xRange[1], num = samplingDensity)
     else:
         xDense = numpy.linspace(xRange[0], xRange[1], num = samplingDensity)
     yDense = [function(X) for X in xDense]
@@ -372,6 +403,9 @@ def curveVLine(function: object, x0: list,
         An object of class 'matplotlib.Figure' holding the contour plot 
         and the line plot.
     """
+    # Save the plot only once, after all elements are drawn
+    filename = kwargs.pop('filename', '')
+    fileFormat = kwargs.pop('fileFormat', 'png')
     figure = curve(function, **kwargs)
     
     if type(x0) != list:
@@ -382,6 +416,6 @@ def curveVLine(function: object, x0: list,
         vlineStyles = [vlineStyles] * len(x0)
     for X, color, style in zip(x0, vlineColors, vlineStyles):
         figure.axes[0].axvline(X, color = color, linestyle = style)
-    if 'filename' in kwargs and len(kwargs['filename']) > 0:
-        figure.savefig(kwargs['filename'], format = 'png')
+    if len(filename) > 0:
+        figure.savefig(filename, format = fileFormat)
     return figure
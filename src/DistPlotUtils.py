@@ -9,20 +9,33 @@ Following third-party libraries are required:
 """
 
 import numpy
+import matplotlib.figure as Figure
 import matplotlib.pyplot as PyPlot
 
 
-def filterFinite(values: list) -> list:
-    return [X != numpy.inf and X != -numpy.inf for X in values]
+def filterFinite(values: list) -> numpy.ndarray:
+    return numpy.isfinite(numpy.asarray(values, dtype = float))
+
+def applyFunction(function: object, x: list) -> numpy.ndarray:
+    # Evaluate the whole array at once if the callable supports it, 
+    # otherwise fall back to one call per (original) element
+    try:
+        xArray = numpy.asarray(x, dtype = float)
+        y = numpy.asarray(function(xArray), dtype = float)
+        if y.shape == xArray.shape:
+            return y
+    except Exception:
+        pass
+    return numpy.asarray(list(map(function, x)), dtype = float)
 
 def hist(x: list, filename = '', transform = None, binCount = 10, 
-         color = None, xlim = None, ylim = None) -> object:
+         color = None, xlim = None, ylim = None, append = None) -> object:
     '''
     Draw a histogram of a data series.
 
     Parameters
     ----------
-    x : list
+    x : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
     filename : str, optional
@@ -48,6 +61,9 @@ def hist(x: list, filename = '', transform = None, binCount = 10,
         (upper) bound of the Y axis. 
         The default is None, i.e. the axis range is automatically determined 
         from the data range.
+    append : matplotlib.Figure or NoneType, optional
+        An object of matplotlib.Figure to which the histogram is appended, 
+        or None if a new Figure shall be created. The default is None.
 
     Returns
     -------
@@ -56,14 +72,27 @@ def hist(x: list, filename = '', transform = None, binCount = 10,
     '''
     # Transform the data before plotting
     if transform != None:
-        x = list(map(transform, x))
+        x = applyFunction(transform, x)
+    
+    # Exclude infinite and NaN values
+    x = numpy.asarray(x, dtype = float)
+    x = x[filterFinite(x)]
     
-    # Exclude infinite values
-    x = [X for X, mask in zip(x, filterFinite(x)) if mask]
+    # Get an existing plot
+    if type(append) == Figure.Figure:
+        figure = append
+        if len(append.get_axes()) > 0:
+            axes = figure.get_axes()[0]
+        else:
+            axes = figure.subplots()
+    else:
+        figure, axes = PyPlot.subplots()
     
-    # Make a scatter plot
-    figure, axes = PyPlot.subplots()
-    axes.hist(x, bins = binCount, color = color)
+    # Make a histogram
+    # (leave out a missing color, so that the color cycle still advances)
+    counts, edges = numpy.histogram(x, bins = binCount)
+    axes.stairs(counts, edges, fill = True, 
+                **({} if color is None else {'color': color}))
     
     # Adjust the plot range
     if xlim != None:
@@ -80,13 +109,13 @@ def hist(x: list, filename = '', transform = None, binCount = 10,
 def histVLine(x: list, x0: list, filename = '', transform = None, 
               binCount = 10, color = None, 
               lineColors = None, lineStyles = None, 
-              xlim = None, ylim = None) -> object:
+              xlim = None, ylim = None, append = None) -> object:
     '''
     Draw a histogram of a data series plus several vertical lines.
     
     Parameters
     ----------
-    x : list
+    x : list or numpy.ndarray
         A list of numeric values representing the data point projected 
         on the X (horizontal) axis.
     x0 : list
@@ -121,6 +150,9 @@ def histVLine(x: list, x0: list, filename = '', transform = None,
         (upper) bound of the Y axis. 
         The default is None, i.e. the axis range is automatically determined 
         from the data range.
+    append : matplotlib.Figure or NoneType, optional
+        An object of matplotlib.Figure to which the histogram is appended, 
+        or None if a new Figure shall be created. The default is None.
     
     Returns
     -------
@@ -129,14 +161,27 @@ def histVLine(x: list, x0: list, filename = '', transform = None,
     '''
     # Transform the data before plotting
     if transform != None:
-        x = list(map(transform, x))
+        x = applyFunction(transform, x)
+    
+    # Exclude infinite and NaN values
+    x = numpy.asarray(x, dtype = float)
+    x = x[filterFinite(x)]
     
-    # Exclude infinite values
-    x = [X for X, mask in zip(x, filterFinite(x)) if mask]
+    # Get an existing plot
+    if type(append) == Figure.Figure:
+        figure = append
+        if len(append.get_axes()) > 0:
+            axes = figure.get_axes()[0]
+        else:
+            axes = figure.subplots()
+    else:
+        figure, axes = PyPlot.subplots()
     
-    # Make a scatter plot
-    figure, axes = PyPlot.subplots()
-    axes.hist(x, bins = binCount, color = color)
+    # Make a histogram
+    # (leave out a missing color, so that the color cycle still advances)
+    counts, edges = numpy.histogram(x, bins = binCount)
+    axes.stairs(counts, edges, fill = True, 
+                **({} if color is None else {'color': color}))
     
     # Add verticle lines
     if type(x0) != list:
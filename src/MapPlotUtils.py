@@ -5,30 +5,41 @@ Python script for plotting maps of data points.
 
 Following third-party libraries are required:
     matplotlib
+    numpy
 """
 
-import math
+import numpy
 import matplotlib
+import matplotlib.figure as Figure
 import matplotlib.pyplot as PyPlot
 import matplotlib.colors as Colors
 
 
+def getTicks(values: list) -> tuple:
+    # Keep the positions and labels of all ticks that are not None
+    values = numpy.asarray(values, dtype = object)
+    masks = numpy.not_equal(values, None)
+    return numpy.nonzero(masks)[0], values[masks]
+
 def heatmap2D(Z: list, X = None, Y = None, filename = '', 
               inverseX = False, inverseY = True, transpose = False, 
               paletteName = 'viridis', colorNA = 'white', 
               xLabel = None, yLabel = None, 
               fillLabel = None, fillLogScale = False, 
-              rotateLabelX = 45, rotateLabelY = 0) -> object:
+              rotateLabelX = 45, rotateLabelY = 0, lowPrecision = False, 
+              append = None) -> object:
     """
     Draw a 2-D heatmap.
 
     Parameters
     ----------
-    Z : list
-        A list of list of numeric values representing the data points.
+    Z : list or numpy.ndarray
+        A list of list (or a 2-D array) of numeric values representing 
+        the data points.
         The length of the outer list equals to the grid number on the 
         horizontal direction, and the length of the inner list equals to 
         the grid number on the vertical direction.
+        Values of None are regarded as missing data (NaN).
     X : list or NoneType, optional
         A list of numeric values representing the axis ticks on the 
         horizontal axis. The default is None.
@@ -50,8 +61,9 @@ def heatmap2D(Z: list, X = None, Y = None, filename = '',
     paletteName : str, optional
         A string indicating the name of the built-in palette.
         The default is 'viridis'.
-    colorNA : str, optional
-         A string indicating the color for invalid values (NaN).
+    colorNA : str or tuple, optional
+         A string (or a tuple of RGB/RGBA values) indicating the color for 
+         invalid values (NaN).
          The default is 'white'.
     xLabel : str or NoneType, optional
         A string used as a title for the x axis, or None if no title. 
@@ -72,39 +84,54 @@ def heatmap2D(Z: list, X = None, Y = None, filename = '',
     rotateLabelY : float, optional
         A numeric value indicating the angle of tick labels on the Y axis.
         The default is 0 (degrees).
+    lowPrecision : bool, optional
+        A boolean indicating whether the data should be converted to 32-bit 
+        float numbers before drawing, which speeds up color mapping on large 
+        grids at the cost of precision.
+        The default is False.
+    append : matplotlib.Figure or NoneType, optional
+        An object of matplotlib.Figure to which the heatmap is appended, 
+        or None if a new Figure shall be created. The default is None.
 
     Returns
     -------
     object
         An object of class 'matplotlib.Figure' holding the heatmap plot.
     """
-    figure, axes = PyPlot.subplots()
-    if len(Z) == 0 or len(Z[0]) == 0:
-        return figure
-    if transpose:
-        Z = [[math.nan if W is None else W for W in V] for V in Z]
+    # Get an existing plot
+    if type(append) == Figure.Figure:
+        figure = append
+        if len(append.get_axes()) > 0:
+            axes = figure.get_axes()[0]
+        else:
+            axes = figure.subplots()
     else:
-        Z = [[math.nan if z[i] is None else z[i] for z in Z] 
-             for i in range(0, len(Z[0]))]
+        figure, axes = PyPlot.subplots()
+    
+    # Convert the data in one pass (None values become NaN)
+    Z = numpy.asarray(Z, dtype = float)
+    if Z.ndim != 2 or Z.size == 0:
+        return figure
+    if not transpose:
+        Z = Z.T
+    if lowPrecision:
+        Z = Z.astype(numpy.float32, copy = False)
     
     if fillLogScale:
         norm = Colors.LogNorm()
     else:
         norm = None
     
-    colorMap = matplotlib.colormaps[paletteName]
-    colorMap.set_bad(colorNA)
+    colorMap = matplotlib.colormaps[paletteName].with_extremes(bad = colorNA)
     heatmap = axes.imshow(Z, norm = norm, cmap = colorMap)
     colorbar = figure.colorbar(heatmap, shrink = 0.75)
     
     if X is not None:
-        axes.set_xticks([i for i in range(0, len(X)) if X[i] is not None], 
-                        labels = [x for x in X if x is not None], 
-                        rotation = rotateLabelX)
+        ticks, labels = getTicks(X)
+        axes.set_xticks(ticks, labels = labels, rotation = rotateLabelX)
     if Y is not None:
-        axes.set_yticks([i for i in range(0, len(Y)) if Y[i] is not None], 
-                        labels = [y for y in Y if y is not None], 
-                        rotation = rotateLabelY)
+        ticks, labels = getTicks(Y)
+        axes.set_yticks(ticks, labels = labels, rotation = rotateLabelY)
     if inverseX:
         axes.invert_xaxis()
     if inverseY:
@@ -5,19 +5,127 @@ Python script for splitting axes in figures.
 
 Following third-party libraries are required:
     matplotlib
+    numpy
 """
 
-import matplotlib.pyplot as PyPlot
+import functools
+import numpy
 import matplotlib.figure as Figure
 import matplotlib.artist as Artist
 import matplotlib.axis as Axis
 import matplotlib.collections as Collections
 import matplotlib.lines as Lines
+import matplotlib.markers as Markers
 import matplotlib.patches as Patches
+import matplotlib.path as Path
 import matplotlib.spines as Spine
 import matplotlib.text as Text
+import matplotlib.transforms as Transforms
 
 
+# Artists that every new axes creates by itself and thus are not cloned
+skippedArtistTypes = (Axis.Axis, Patches.Patch, Spine.Spine, Text.Text)
+
+# Style of the slanted lines denoting a broken axis
+slantedMarker = Markers.MarkerStyle(Path.Path([(-1, -1), (1, 1)], 
+                                              [Path.Path.MOVETO, 
+                                               Path.Path.LINETO]))
+slantedLineParameters = dict(marker = slantedMarker, markersize = 12, 
+                             linestyle = 'none', color = 'black', 
+                             markeredgewidth = 1, clip_on = False)
+
+def makePathCollectionCloner(artist: Collections.PathCollection) -> object:
+    # Reuse the markers and the (N, 2) offset array of the original artist
+    artistType = artist.__class__
+    paths = artist.get_paths()
+    properties = dict(sizes = artist.get_sizes(), 
+                      offsets = artist.get_offsets(), 
+                      facecolors = artist.get_facecolors(), 
+                      edgecolors = artist.get_edgecolors(), 
+                      linewidths = artist.get_linewidths())
+    def clone(axes = None):
+        newArtist = artistType(paths, offset_transform = axes.transData, 
+                               **properties)
+        newArtist.set_transform(Transforms.IdentityTransform())
+        return newArtist
+    return clone
+
+def makeAxisCloner(artist: Axis.Axis) -> object:
+    artistType = artist.__class__
+    return lambda axes = None: artistType(axes)
+
+def makeLineCloner(artist: Lines.Line2D) -> object:
+    # Keep the style of the original line (but not its transform)
+    artistType = artist.__class__
+    xData, yData = artist.get_xdata(), artist.get_ydata()
+    properties = dict(color = artist.get_color(), 
+                      linestyle = artist.get_linestyle(), 
+                      linewidth = artist.get_linewidth(), 
+                      drawstyle = artist.get_drawstyle(), 
+                      marker = artist.get_marker(), 
+                      markersize = artist.get_markersize(), 
+                      markeredgewidth = artist.get_markeredgewidth(), 
+                      markeredgecolor = artist.get_markeredgecolor(), 
+                      markerfacecolor = artist.get_markerfacecolor(), 
+                      markerfacecoloralt = artist.get_markerfacecoloralt(), 
+                      fillstyle = artist.get_fillstyle(), 
+                      markevery = artist.get_markevery(), 
+                      alpha = artist.get_alpha(), 
+                      zorder = artist.get_zorder())
+    return lambda axes = None: artistType(xData, yData, **properties)
+
+def makeRectangleCloner(artist: Patches.Rectangle) -> object:
+    artistType = artist.__class__
+    xy, width, height = artist.xy, artist.get_width(), artist.get_height()
+    return lambda axes = None: artistType(xy, width, height)
+
+def makeSpineCloner(artist: Spine.Spine) -> object:
+    artistType = artist.__class__
+    spineType, path = artist.spine_type, artist.get_path()
+    return lambda axes = None: artistType(axes, spineType, path)
+
+def makeTextCloner(artist: Text.Text) -> object:
+    artistType = artist.__class__
+    (x, y), text = artist.get_position(), artist.get_text()
+    return lambda axes = None: artistType(x, y, text)
+
+# Functions making the cloner for each supported type of artist
+artistCloners = {Collections.PathCollection: makePathCollectionCloner, 
+                 Axis.Axis: makeAxisCloner, 
+                 Lines.Line2D: makeLineCloner, 
+                 Patches.Rectangle: makeRectangleCloner, 
+                 Spine.Spine: makeSpineCloner, 
+                 Text.Text: makeTextCloner}
+
+def getCloner(artist: Artist.Artist) -> object:
+    '''
+    Read the data of a paintable element (artist) for later duplication
+
+    Parameters
+    ----------
+    artist : Artist
+        An object of class 'matplotlib.artist.Artist' to duplicate.
+
+    Returns
+    -------
+    object
+        A callable object accepting an optional object of class 
+        'matplotlib.axes.Axes', and returning a new duplicate of the 
+        element each time it is called.
+    '''
+    maker = artistCloners.get(type(artist))
+    if maker is None:
+        # Look for a supported base class of the artist
+        for artistType, function in artistCloners.items():
+            if isinstance(artist, artistType):
+                maker = function
+                break
+        else:
+            raise TypeError('The artist of type "{}" cannot be cloned.'.
+                            format(type(artist)))
+    
+    return maker(artist)
+
 def cloneArtist(artist: Artist.Artist, axes = None) -> Artist.Artist:
     '''
     Duplicate a paintable element (artist)
@@ -37,35 +145,74 @@ def cloneArtist(artist: Artist.Artist, axes = None) -> Artist.Artist:
         An object of class 'matplotlib.artist.Artist' holding 
         the duplicated element.
     '''
-    if isinstance(artist, Collections.PathCollection):
-        data = artist.get_offsets().data.T
-        newArtist = axes.scatter(data[0], data[1])
-        newArtist.set_facecolors(artist.get_facecolors())
-        newArtist.set_edgecolors(artist.get_edgecolors())
-    elif isinstance(artist, Axis.Axis):
-        newArtist = artist.__class__(axes)
-    elif isinstance(artist, Lines.Line2D):
-        newArtist = artist.__class__(artist.get_xdata(), artist.get_ydata(),
-                                     color = artist.get_color())
-    elif isinstance(artist, Patches.Rectangle):
-        newArtist = artist.__class__(artist.xy, 
-                                     artist.get_width(), artist.get_height())
-    elif isinstance(artist, Spine.Spine):
-        newArtist = artist.__class__(axes, artist.spine_type, 
-                                     artist.get_path())
-    elif isinstance(artist, Text.Text):
-        newArtist = artist.__class__(artist.get_position()[0], 
-                                     artist.get_position()[1], 
-                                     artist.get_text())
+    return getCloner(artist)(axes)
+
+def moveArtist(artist: Artist.Artist, axes = None) -> Artist.Artist:
+    '''
+    Move a paintable element (artist) from its axes to another one
+
+    Parameters
+    ----------
+    artist : Artist
+        An object of class 'matplotlib.artist.Artist' to move.
+    axes : Axes or NoneType, optional
+        An object of class 'matplotlib.axes.Axes' to which 
+        the element is attached afterwards.
+        The default is None, i.e. the element is made free.
+
+    Returns
+    -------
+    Artist
+        The object 'artist' detached from its original axes, or a duplicate 
+        of it (see **cloneArtist**) if it is not drawn in data coordinates.
+    '''
+    oldAxes = artist.axes
+    if isinstance(artist, Lines.Line2D) and \
+       artist.get_transform() is oldAxes.transData:
+        artist.remove()
+        if axes is not None:
+            artist.set_transform(axes.transData)
+    elif isinstance(artist, Collections.PathCollection) and \
+         artist.get_offset_transform() is oldAxes.transData:
+        artist.remove()
+        if axes is not None:
+            artist.set_offset_transform(axes.transData)
     else:
-        raise TypeError('The artist of type "{}" cannot be cloned.'.
-                        format(type(artist)))
-    
-    return newArtist
+        return cloneArtist(artist, axes)
+    artist.set_clip_path(None)
+    return artist
+
+def padRatio(ratio: list, count: int) -> numpy.ndarray:
+    # Share the remaining proportion equally among the missing elements
+    ratio = numpy.asarray(ratio, dtype = float)
+    if ratio.size >= count:
+        return ratio
+    newRatio = numpy.empty(count)
+    newRatio[:ratio.size] = ratio
+    newRatio[ratio.size:] = (1 - ratio.sum()) / (count - ratio.size)
+    return newRatio
+
+@functools.lru_cache(maxsize = 32)
+def getLayout(columnCount: int, rowCount: int, 
+              xRatio: tuple, yRatio: tuple) -> tuple:
+    # Relative width of each column, relative height of each row (from top 
+    # to bottom), and whether each corner (lower left, lower right, 
+    # upper left, upper right) of each subplot gets a slanted line
+    widths = tuple(padRatio(xRatio, columnCount))
+    heights = tuple(padRatio(yRatio, rowCount)[::-1])
+    i = numpy.arange(columnCount)[numpy.newaxis, :]
+    j = numpy.arange(rowCount)[:, numpy.newaxis]
+    cornerMasks = numpy.stack(((i > 0) ^ (j < rowCount - 1), 
+                               (i < columnCount - 1) ^ (j < rowCount - 1), 
+                               (i == 0) ^ (j == 0), 
+                               (i < columnCount - 1) ^ (j > 0)), axis = -1)
+    cornerMasks.setflags(write = False)
+    return widths, heights, cornerMasks
 
 def splitAxes(figure: Figure, filename = '', fileFormat = 'png', 
               xSubranges = [], ySubranges = [], xRatio = [], yRatio = [],
-              xSpacing = 0.05, ySpacing = 0.05) -> Figure.Figure:
+              xSpacing = 0.05, ySpacing = 0.05, 
+              consumeSource = False) -> Figure.Figure:
     '''
     Split the axes in a plot into subplots and create broken axes
 
@@ -101,11 +248,19 @@ def splitAxes(figure: Figure, filename = '', fileFormat = 'png',
     ySpacing : float, optional
         A float number indicating the vertical spacing between splitted plot.
         The default is 0.05.
+    consumeSource : bool, optional
+        A boolean indicating whether the artists in 'figure' can be moved 
+        into the first subplot instead of being duplicated. 'figure' should 
+        not be used (e.g. with **updateSplitAxes**) afterwards.
+        The default is False.
 
     Returns
     -------
     Figure
         An object of class 'matplotlib.Figure' holding the splitted plot.
+        The figure is not managed by pyplot, so PyPlot.show() does not 
+        display it; call PyPlot.figure(newFigure) first to display it (or 
+        to draw it interactively).
     '''
     if len(figure.axes) == 0:
         return figure
@@ -113,82 +268,80 @@ def splitAxes(figure: Figure, filename = '', fileFormat = 'png',
     # Determine the number of column and row
     columnCount = max(len(xSubranges), 1)
     rowCount = max(len(ySubranges), 1)
-    if len(xRatio) < columnCount:
-        xRatio = xRatio + \
-                 [(1 - sum(xRatio)) / (columnCount - len(xRatio))] * \
-                 (columnCount - len(xRatio))
-    if len(yRatio) < rowCount:
-        yRatio = yRatio + \
-                 [(1 - sum(yRatio)) / (rowCount - len(yRatio))] * \
-                 (rowCount - len(yRatio))
+    xRatio, yRatio, cornerMasks = getLayout(columnCount, rowCount, 
+                                            tuple(xRatio), tuple(yRatio))
     
     # Inverse the parameter order for the vertical axis
     ySubranges = ySubranges[::-1]
-    yRatio = yRatio[::-1]
     
     # Draw a new figure with the specified layout
-    newFigure, _ = PyPlot.subplots(rowCount, columnCount, 
-                                   gridspec_kw = {'width_ratios': xRatio, 
-                                                  'height_ratios': yRatio}, 
-                                   sharex = columnCount < 2, 
-                                   sharey = rowCount < 2)
+    # (without pyplot, so that no global state or backend is involved)
+    newFigure = Figure.Figure()
+    gridSpec = newFigure.add_gridspec(rowCount, columnCount, 
+                                      width_ratios = xRatio, 
+                                      height_ratios = yRatio)
+    newAxesGrid = gridSpec.subplots(sharex = 'col', sharey = 'row', 
+                                    squeeze = False)
     newFigure.subplots_adjust(hspace = ySpacing if columnCount else None, 
                               wspace = xSpacing if rowCount else None)
     
-    # Add artists in the existing plot to each subplot in the new plot
+    # Add artists in the existing plot to each subplot in the new plot, 
+    # reading the data of each artist only once for all subplots
     axes = figure.axes[0]
-    artists = axes.get_children()
+    artists = [artist for artist in axes.get_children() 
+               if not isinstance(artist, skippedArtistTypes)]
+    if consumeSource and columnCount * rowCount == 1:
+        # The only subplot takes the original artists, so nothing is cloned
+        cloners = []
+    else:
+        cloners = [getCloner(artist) for artist in artists]
+    xlim, ylim = axes.get_xlim(), axes.get_ylim()
+    xScale, yScale = axes.get_xscale(), axes.get_yscale()
+    xSubrangeCount, ySubrangeCount = len(xSubranges), len(ySubranges)
+    rowTickParameters = [dict(bottom = (j == rowCount - 1), 
+                              labelbottom = (j == rowCount - 1), 
+                              top = False) 
+                         for j in range(0, rowCount)]
+    columnTickParameters = [dict(left = (i == 0), labelleft = (i == 0), 
+                                 right = False) 
+                            for i in range(0, columnCount)]
     for i in range(0, columnCount):
         for j in range(0, rowCount):
-            newAxes = newFigure.axes[i + j * rowCount]
-            for artist in artists:
-                if not any(isinstance(artist, X) 
-                           for X in 
-                           (Axis.Axis, Patches.Patch, Spine.Spine, Text.Text)):
-                    newAxes.add_artist(cloneArtist(artist, newAxes))
-            if len(xSubranges) > 0 and i < len(xSubranges):
-                newAxes.set_xlim(xSubranges[i])
-            else:
-                newAxes.set_xlim(axes.get_xlim())
-            if len(ySubranges) > 0 and j < len(ySubranges):
-                newAxes.set_ylim(ySubranges[j])
+            newAxes = newAxesGrid[j, i]
+            newAxes.set_autoscale_on(False)
+            # (subplots in a column share the x axis, and those in a row 
+            # share the y axis)
+            if j == 0:
+                newAxes.set_xlim(xSubranges[i] if i < xSubrangeCount else xlim)
+                newAxes.set_xscale(xScale)
+            if i == 0:
+                newAxes.set_ylim(ySubranges[j] if j < ySubrangeCount else ylim)
+                newAxes.set_yscale(yScale)
+            if consumeSource and i == 0 and j == 0:
+                for artist in artists:
+                    newAxes.add_artist(moveArtist(artist, newAxes))
             else:
-                newAxes.set_ylim(axes.get_ylim())
-            newAxes.set_xscale(axes.get_xscale())
-            newAxes.set_yscale(axes.get_yscale())
-            newAxes.tick_params(bottom = (j == rowCount - 1), 
-                                labelbottom = (j == rowCount - 1), 
-                                top = False, 
-                                left = (i == 0), 
-                                labelleft = (i == 0), 
-                                right = False)
-            newAxes.spines.bottom.set_visible(j == rowCount - 1)
-            newAxes.spines.top.set_visible(j == 0)
-            newAxes.spines.left.set_visible(i == 0)
-            newAxes.spines.right.set_visible(i == columnCount - 1)
-            newAxes.xaxis.set_ticks_position('bottom' if j == rowCount - 1 
-                                             else 'none')
-            newAxes.yaxis.set_ticks_position('left' if i == 0 else 'none')
+                for cloner in cloners:
+                    newAxes.add_artist(cloner(newAxes))
+            newAxes.tick_params(which = 'both', **rowTickParameters[j], 
+                                **columnTickParameters[i])
+            spines = newAxes.spines
+            spines['bottom'].set_visible(j == rowCount - 1)
+            spines['top'].set_visible(j == 0)
+            spines['left'].set_visible(i == 0)
+            spines['right'].set_visible(i == columnCount - 1)
     
-    # Add slanted lines on the axes
-    parameters = dict(marker=[(-1, -1), (1, 1)], 
-                      markersize = 12, linestyle = 'none', 
-                      color = 'black', mew = 1, clip_on = False)
+    # Add slanted lines on the axes, with one line plot per subplot
+    corners = numpy.array([(0, 0), (1, 0), (0, 1), (1, 1)])
     for i in range(0, columnCount):
         for j in range(0, rowCount):
-            newAxes = newFigure.axes[i + j * rowCount]
-            if (i > 0) ^ (j < rowCount - 1):
-                newAxes.plot([0], [0], transform = newAxes.transAxes, 
-                             **parameters)
-            if (i < columnCount - 1) ^ (j < rowCount - 1):
-                newAxes.plot([1], [0], transform = newAxes.transAxes, 
-                             **parameters)
-            if (i == 0) ^ (j == 0):
-                newAxes.plot([0], [1], transform = newAxes.transAxes, 
-                             **parameters)
-            if (i < columnCount - 1) ^ (j > 0):
-                newAxes.plot([1], [1], transform = newAxes.transAxes, 
-                             **parameters)
+            newAxes = newAxesGrid[j, i]
+            masks = cornerMasks[j, i]
+            if masks.any():
+                points = corners[masks]
+                newAxes.add_line(Lines.Line2D(points[:, 0], points[:, 1], 
+                                              transform = newAxes.transAxes, 
+                                              **slantedLineParameters))
     
     newFigure.supxlabel(axes.get_xlabel())
     newFigure.supylabel(axes.get_ylabel())
@@ -201,3 +354,51 @@ def splitAxes(figure: Figure, filename = '', fileFormat = 'png',
         newFigure.savefig(filename, format = fileFormat)
     
     return newFigure
+
+def updateSplitAxes(newFigure: Figure.Figure, 
+                    figure: Figure.Figure) -> list:
+    '''
+    Update the data of a splitted plot from the plot it was created from
+
+    Parameters
+    ----------
+    newFigure : Figure
+        An object of class 'matplotlib.Figure' returned by **splitAxes**.
+    figure : Figure
+        An object of class 'matplotlib.Figure' passed to **splitAxes** when 
+        creating 'newFigure', whose artists may have new data since then.
+
+    Returns
+    -------
+    list
+        A list of objects of class 'matplotlib.artist.Artist' holding 
+        the updated elements in 'newFigure', which can be redrawn on their 
+        own (e.g. with blitting) instead of redrawing the whole figure.
+        Blitting needs a drawing canvas, so 'newFigure' should have been 
+        adopted by pyplot with PyPlot.figure(newFigure) beforehand.
+    '''
+    if len(figure.axes) == 0:
+        return []
+    
+    artists = [artist for artist in figure.axes[0].get_children() 
+               if not isinstance(artist, skippedArtistTypes)]
+    updatedArtists = []
+    for newAxes in newFigure.axes:
+        # Pair the cloned artists with the original ones, skipping 
+        # the slanted lines (the only ones drawn in axes coordinates)
+        newArtists = [artist for artist in newAxes.get_children() 
+                      if not isinstance(artist, skippedArtistTypes) and 
+                         artist.get_transform() is not newAxes.transAxes]
+        if len(newArtists) != len(artists):
+            raise ValueError('The splitted plot does not match the plot '
+                             'it is updated from.')
+        for artist, newArtist in zip(artists, newArtists):
+            if isinstance(artist, Lines.Line2D):
+                newArtist.set_data(artist.get_xdata(), artist.get_ydata())
+            elif isinstance(artist, Collections.PathCollection):
+                newArtist.set_offsets(artist.get_offsets())
+            else:
+                continue
+            updatedArtists.append(newArtist)
+    
+    return updatedArtists